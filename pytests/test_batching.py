@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+from typing import Any
+
+from pydmart.service import DmartException, DmartResponse, Error, _BatchCoalescer
+
+
+def record(shortname: str, subpath: str = "posts") -> dict[str, Any]:
+    return {"resource_type": "content", "subpath": subpath, "shortname": shortname, "attributes": {}}
+
+
+class BatchCoalescerTest(unittest.IsolatedAsyncioTestCase):
+    async def submit_all(self, send, records, window: float = 0.01, max_size: int = 64):
+        coalescer = _BatchCoalescer(send, window, max_size)
+        futures = [coalescer.submit(r) for r in records]
+        return await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), 1)
+
+    async def test_records_are_sent_in_one_call_and_matched_by_key(self):
+        calls = []
+
+        async def send(records):
+            calls.append(records)
+            return DmartResponse.model_validate({"status": "success", "records": list(reversed(records))})
+
+        results = await self.submit_all(send, [record("a"), record("b", "/other/")])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([r.records[0].shortname for r in results], ["a", "b"])
+        self.assertEqual(results[1].records[0].subpath, "other")
+
+    async def test_unmatched_records_fall_back_to_response_order(self):
+        async def send(records):
+            return DmartResponse.model_validate(
+                {"status": "success", "records": [dict(r, shortname=f"gen{i}") for i, r in enumerate(records)]}
+            )
+
+        results = await self.submit_all(send, [record("x"), record("y")])
+        self.assertEqual([r.records[0].shortname for r in results], ["gen0", "gen1"])
+
+    async def test_record_missing_from_response_raises(self):
+        async def send(records):
+            return DmartResponse.model_validate({"status": "success", "records": [records[0]]})
+
+        ok, missing = await self.submit_all(send, [record("a"), record("b")])
+        self.assertEqual(ok.records[0].shortname, "a")
+        self.assertIsInstance(missing, DmartException)
+
+    async def test_max_size_flushes_without_waiting_for_the_window(self):
+        calls = []
+
+        async def send(records):
+            calls.append(len(records))
+            return DmartResponse.model_validate({"status": "success", "records": records})
+
+        await self.submit_all(send, [record(f"s{i}") for i in range(5)], window=60, max_size=5)
+        self.assertEqual(calls, [5])
+
+    async def test_repeated_entry_starts_a_new_batch(self):
+        calls = []
+
+        async def send(records):
+            calls.append([r["attributes"] for r in records])
+            return DmartResponse.model_validate({"status": "success", "records": records})
+
+        first, other, second = await self.submit_all(
+            send,
+            [dict(record("a"), attributes={"n": 1}), record("b"), dict(record("a", "/posts/"), attributes={"n": 2})],
+        )
+        self.assertEqual(calls, [[{"n": 1}, {}], [{"n": 2}]])
+        self.assertEqual((first.records[0].attributes, second.records[0].attributes), ({"n": 1}, {"n": 2}))
+
+    async def test_partial_failure_resolves_each_record(self):
+        async def send(records):
+            raise DmartException(400, Error(
+                type="request",
+                code=400,
+                message="Something went wrong",
+                info=[{
+                    "successfull": [record("ok1")],
+                    "failed": [{"record": record("bad"), "error": "Entry already exists", "error_code": 415}],
+                }],
+            ))
+
+        ok, bad, unknown = await self.submit_all(send, [record("ok1"), record("bad"), record("unlisted")])
+        self.assertIsInstance(ok, DmartResponse)
+        self.assertEqual(ok.records[0].shortname, "ok1")
+        self.assertIsInstance(bad, DmartException)
+        self.assertEqual((bad.status_code, bad.error.code, bad.error.message), (400, 415, "Entry already exists"))
+        self.assertIsInstance(unknown, DmartException)
+        self.assertEqual(unknown.error.message, "Something went wrong")
+
+    async def test_cancelled_send_cancels_waiting_callers(self):
+        started = asyncio.Event()
+
+        async def send(records):
+            started.set()
+            await asyncio.Event().wait()
+
+        coalescer = _BatchCoalescer(send, 0, 64)
+        futures = [coalescer.submit(record("a")), coalescer.submit(record("b"))]
+        await started.wait()
+        for task in list(coalescer.tasks):
+            task.cancel()
+        results = await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), 1)
+        self.assertTrue(all(isinstance(r, asyncio.CancelledError) for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
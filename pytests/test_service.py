@@ -0,0 +1,229 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pydantic import ValidationError
+
+from pydmart.service import DmartException, DmartService, RawDmartResponse, _TTLCache
+
+
+def make_app(state: dict) -> web.Application:
+    async def login(request: web.Request) -> web.Response:
+        return web.json_response({
+            "status": "success",
+            "records": [{
+                "resource_type": "user",
+                "subpath": "users",
+                "shortname": "dmart",
+                "attributes": {"access_token": "token"},
+            }],
+        })
+
+    async def no_content(request: web.Request) -> web.Response:
+        return web.Response(status=204)
+
+    async def entry(request: web.Request) -> web.Response:
+        shortname = request.match_info["shortname"]
+        if shortname == "empty":
+            return web.Response(status=204)
+        state["reads"] += 1
+        etag = f'"{state["version"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            state["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(
+            {
+                "uuid": "d6b5d9a4-0c0e-4f6e-9a44-6a1f1f2b6c1e",
+                "shortname": shortname,
+                "is_active": True,
+                "created_at": "2024-01-01T00:00:00",
+                "owner_shortname": "dmart",
+                "payload": {"content_type": "json", "body": {"version": state["version"]}},
+            },
+            headers={"ETag": etag},
+        )
+
+    async def request_(request: web.Request) -> web.Response:
+        body = await request.json()
+        state["requests"].append([r["shortname"] for r in body["records"]])
+        state["version"] += 1
+        return web.json_response({"status": "success", "records": body["records"]})
+
+    async def query(request: web.Request) -> web.Response:
+        body = await request.json()
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            state["in_flight"] -= 1
+        state["queries"] += 1
+        if body["subpath"] == "bad":
+            return web.json_response(
+                {"status": "failed", "error": {"type": "request", "code": 400, "message": "bad query"}},
+                status=400,
+            )
+        if body["subpath"] == "empty":
+            return web.Response(status=204)
+        records = [
+            {"resource_type": "content", "subpath": body["subpath"], "shortname": f"e{i}", "attributes": {}}
+            for i in range(body.get("limit", 0))
+        ]
+        return web.json_response({"status": "success", "records": records, "attributes": {"subpath": body["subpath"]}})
+
+    app = web.Application()
+    app.router.add_post("/user/login", login)
+    app.router.add_put("/managed/progress-ticket/{tail:.*}", no_content)
+    app.router.add_get("/managed/entry/{resource_type}/{space_name}/{subpath:.*}/{shortname}", entry)
+    app.router.add_post("/managed/request", request_)
+    app.router.add_post("/managed/query", query)
+    return app
+
+
+class DmartServiceTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.state = {
+            "version": 1,
+            "reads": 0,
+            "not_modified": 0,
+            "requests": [],
+            "queries": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+        }
+        self.server = TestServer(make_app(self.state))
+        await self.server.start_server()
+        self.url = str(self.server.make_url("")).rstrip("/")
+        self.client = await DmartService.new(self.url, "dmart", "password")
+
+    async def asyncTearDown(self):
+        await DmartService.delete_session_pool()
+        await self.server.close()
+
+    async def test_no_content_is_an_empty_success(self):
+        response = await self.client.progress_ticket("space", "tickets", "t1", "close")
+        self.assertEqual(response.status, "success")
+        self.assertEqual(response.records, [])
+
+    async def test_read_without_content_raises(self):
+        with self.assertRaises(DmartException) as raised:
+            await self.client.read("space", "posts", "empty")
+        self.assertEqual(raised.exception.status_code, 204)
+
+    async def test_read_cache_is_off_by_default(self):
+        await self.client.read("space", "posts", "p1")
+        await self.client.read("space", "posts", "p1")
+        self.assertEqual(self.state["not_modified"], 0)
+
+    async def test_cached_read_is_reused_on_304(self):
+        client = await DmartService.new(self.url, "dmart", "password", read_ttl_s=60)
+        first = await client.read("space", "/posts/", "p1")
+        second = await client.read("space", "posts", "p1")
+        self.assertEqual(first, second)
+        self.assertEqual((self.state["reads"], self.state["not_modified"]), (2, 1))
+
+    async def test_writes_invalidate_cached_reads(self):
+        client = await DmartService.new(self.url, "dmart", "password", read_ttl_s=60)
+        await client.read("space", "posts", "p1")
+        await client.update("space", "/posts", "p1", {})
+        entry = await client.read("space", "posts", "p1")
+        self.assertEqual(entry.payload.body, {"version": 2})
+        self.assertEqual(self.state["not_modified"], 0)
+
+    async def test_auto_shortnames_bypass_batching(self):
+        client = await DmartService.new(self.url, "dmart", "password", batch_window_ms=20)
+        await asyncio.gather(
+            client.create("space", "posts", {}),
+            client.create("space", "posts", {}),
+            client.create("space", "posts", {}, shortname="a"),
+            client.create("space", "posts", {}, shortname="b"),
+        )
+        self.assertEqual(sorted(self.state["requests"]), [["a", "b"], ["auto"], ["auto"]])
+
+    async def test_bulk_query_keeps_order_and_concurrency_limit(self):
+        queries = [{"space_name": "space", "subpath": f"p{i}"} for i in range(10)]
+        responses = await self.client.bulk_query(queries, max_concurrency=3)
+        self.assertEqual([r.attributes["subpath"] for r in responses], [f"p{i}" for i in range(10)])
+        self.assertEqual(self.state["max_in_flight"], 3)
+
+    async def test_bulk_query_failure_cancels_remaining_calls(self):
+        queries = [{"space_name": "space", "subpath": "bad"}] + [
+            {"space_name": "space", "subpath": f"p{i}"} for i in range(10)
+        ]
+        with self.assertRaises(DmartException) as raised:
+            await self.client.bulk_query(queries, max_concurrency=2)
+        self.assertEqual(raised.exception.status_code, 400)
+        await asyncio.sleep(0.1)
+        self.assertLess(self.state["queries"], len(queries))
+
+    async def test_bulk_read_rejects_non_positive_concurrency(self):
+        with self.assertRaises(ValueError):
+            await self.client.bulk_read([("space", "posts", "p1")], max_concurrency=0)
+
+    async def test_query_lazy_validates_each_record_once(self):
+        response = await self.client.query_lazy("space", "content", limit=3)
+        self.assertEqual(response.status, "success")
+        self.assertEqual(len(response.records), 3)
+        self.assertEqual(response.records.validated, [None, None, None])
+        first = response.first_record()
+        self.assertEqual(first.shortname, "e0")
+        self.assertEqual(response.records.validated[1:], [None, None])
+        self.assertIs(response.records[0], first)
+        self.assertEqual(response.records[-1].shortname, "e2")
+        self.assertEqual([record.shortname for record in response.records], ["e0", "e1", "e2"])
+        self.assertEqual([record.shortname for record in response.records[1:]], ["e1", "e2"])
+        self.assertIs(next(iter(response.records)), first)
+
+    async def test_query_lazy_without_content_is_an_empty_success(self):
+        response = await self.client.query_lazy("space", "empty")
+        self.assertEqual(response.status, "success")
+        self.assertEqual(len(response.records), 0)
+        self.assertIsNone(response.first_record())
+        with self.assertRaises(IndexError):
+            response.records[0]
+
+    def test_raw_response_validates_the_envelope(self):
+        with self.assertRaises(ValidationError):
+            RawDmartResponse({"records": []})
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_entries_expire(self):
+        cache = _TTLCache(10, 1000, ttl=5)
+        with mock.patch("pydmart.service.time.monotonic", return_value=100):
+            cache.set("k", "g", "v", 1)
+        with mock.patch("pydmart.service.time.monotonic", return_value=104):
+            self.assertEqual(cache.get("k"), "v")
+        with mock.patch("pydmart.service.time.monotonic", return_value=106):
+            self.assertIsNone(cache.get("k"))
+        self.assertEqual((cache.nbytes, cache.groups), (0, {}))
+
+    def test_invalidate_drops_the_whole_group(self):
+        cache = _TTLCache(10, 1000, ttl=60)
+        cache.set("a1", "a", 1, 10)
+        cache.set("a2", "a", 2, 10)
+        cache.set("b1", "b", 3, 10)
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        self.assertEqual((cache.get("a1"), cache.get("a2"), cache.get("b1")), (None, None, 3))
+        self.assertEqual(cache.nbytes, 10)
+
+    def test_least_recently_used_entries_are_evicted_by_count_and_size(self):
+        cache = _TTLCache(2, 100, ttl=60)
+        cache.set("a", "g", 1, 10)
+        cache.set("b", "g", 2, 10)
+        cache.get("a")
+        cache.set("c", "g", 3, 10)
+        self.assertEqual((cache.get("a"), cache.get("b"), cache.get("c")), (1, None, 3))
+        cache.set("d", "h", 4, 95)
+        self.assertEqual((cache.get("a"), cache.get("c"), cache.get("d")), (None, None, 4))
+        cache.set("e", "h", 5, 101)
+        self.assertIsNone(cache.get("e"))
+        self.assertEqual(cache.nbytes, 95)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,16 @@
-from io import BytesIO
-import json
+import asyncio
+import time
+from collections import OrderedDict
+from functools import partial
+from os import PathLike
 import aiohttp
+from yarl import URL
 from enum import StrEnum
-from typing import Any, BinaryIO
-from pydantic import BaseModel, Field, ConfigDict
+from collections.abc import Sequence
+from typing import Any, BinaryIO, Awaitable, Callable, Hashable, Iterator, overload
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic.types import UUID4 as UUID
+from pydantic_core import from_json, to_json
 
 SUBPATH = "^[a-zA-Z\u0621-\u064A0-9\u0660-\u0669_/]{1,128}$"
 SHORTNAME = "^[a-zA-Z\u0621-\u064A0-9\u0660-\u0669_]{1,64}$"
@@ -25,6 +31,12 @@ class RequestType(StrEnum):
     move = "move"
     
     
+# Plain str values used on the hot path instead of going through the enum members
+_REQ_CREATE = RequestType.create.value
+_REQ_UPDATE = RequestType.update.value
+_REQ_DELETE = RequestType.delete.value
+
+
 class RequestMethod(StrEnum):
     get = "get"
     post = "post"
@@ -83,7 +95,7 @@ class ContentType(StrEnum):
     duckdb = "duckdb"
     sqlite = "sqlite"
 class Resource(BaseModel):
-    model_config = ConfigDict(use_enum_values=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(use_enum_values=True, arbitrary_types_allowed=True, defer_build=True, extra="ignore")
 
 class Translation(Resource):
     en: str | None = None
@@ -112,6 +124,8 @@ class Relationship(Resource):
 
 
 class ACL(BaseModel):
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     user_shortname: str
     allowed_actions: list = []
 
@@ -126,6 +140,8 @@ class Payload(Resource):
     body: str | dict[str, Any]
 
 class Error(BaseModel):
+    model_config = ConfigDict(defer_build=True, extra="ignore", frozen=True)
+
     type: str
     code: int
     message: str
@@ -141,20 +157,27 @@ class DmartException(Exception):
         self.error = error
 
 class Record(BaseModel):
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     resource_type: ResourceType
     uuid: UUID | None = None
+    # Checked by pydantic-core's own regex engine, keeps per-record validation out of Python
     shortname: str = Field(pattern=SHORTNAME)
     subpath: str = Field(pattern=SUBPATH)
     attributes: dict[str, Any]
     attachments: dict[ResourceType, list[Any]] | None = None
     retrieve_lock_status: bool = False
 
-    def __init__(self, **data):
-        BaseModel.__init__(self, **data)
-        if self.subpath != "/":
-            self.subpath = self.subpath.strip("/")
+    @field_validator("subpath")
+    @classmethod
+    def strip_subpath(cls, subpath: str) -> str:
+        if subpath != "/" and (subpath[0] == "/" or subpath[-1] == "/"):
+            subpath = subpath.strip("/")
+        return subpath
 
 class Entry(BaseModel): 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     uuid: str
     shortname: str
     is_active: bool
@@ -174,34 +197,376 @@ class Entry(BaseModel):
 
 
 class DmartResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     status: Status
     error: Error | None = None
     records: list[Record] = []
     attributes: dict[str, Any] | None = None
 
+
+# Schemas are built lazily (defer_build), build the ones on the response path up front
+# so the first request doesn't pay for it. Nested-only models stay deferred.
+Error.model_rebuild()
+Record.model_rebuild()
+Entry.model_rebuild()
+DmartResponse.model_rebuild()
+
+
+class _RawDmartEnvelope(BaseModel):
+    """DmartResponse with the records left as plain dicts"""
+    model_config = ConfigDict(extra="ignore")
+
+    status: Status
+    error: Error | None = None
+    records: list[dict[str, Any]] = []
+    attributes: dict[str, Any] | None = None
+
+
+class LazyRecords(Sequence[Record]):
+    """Records validated on first access, each one at most once"""
+
+    __slots__ = ("raw", "validated")
+
+    def __init__(self, raw: list[dict[str, Any]]):
+        self.raw = raw
+        self.validated: list[Record | None] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @overload
+    def __getitem__(self, index: int) -> Record: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[Record]: ...
+    def __getitem__(self, index: int | slice) -> Record | list[Record]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.raw)))]
+        record = self.validated[index]
+        if record is None:
+            record = self.validated[index] = Record.model_validate(self.raw[index])
+        return record
+
+    def __iter__(self) -> Iterator[Record]:
+        for i in range(len(self.raw)):
+            yield self[i]
+
+
+class RawDmartResponse:
+    """A DmartResponse whose records are not validated yet.
+
+    The envelope is validated like `DmartResponse`, records stay plain dicts and
+    are validated into `Record` one at a time as they are accessed, so reading
+    only the first record of a large response doesn't pay for validating the rest.
+    """
+
+    __slots__ = ("status", "error", "attributes", "records")
+
+    def __init__(self, data: dict[str, Any]):
+        envelope = _RawDmartEnvelope.model_validate(data)
+        self.status = envelope.status
+        self.error = envelope.error
+        self.attributes = envelope.attributes
+        self.records = LazyRecords(envelope.records)
+
+    @property
+    def raw_records(self) -> list[dict[str, Any]]:
+        return self.records.raw
+
+    def first_record(self) -> Record | None:
+        return self.records[0] if self.records else None
+
+
+def _error_from_body(status_code: int, raw: bytes) -> Error:
+    try:
+        return Error.model_validate(from_json(raw)["error"])
+    except (ValueError, KeyError, TypeError):
+        # Not a Dmart error body, e.g. a proxy error page
+        return Error(type="request", code=status_code, message=raw.decode(errors="replace"))
+
+
+class _TTLCache:
+    """Small LRU mapping whose entries expire `ttl` seconds after being stored.
+
+    Entries are bounded both by count and by their total size in bytes, and each
+    belongs to a group so all entries of a group can be dropped without a scan.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int, ttl: float):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.nbytes = 0
+        # key -> (expiry, group, size, value)
+        self.data: OrderedDict[Hashable, tuple[float, Hashable, int, Any]] = OrderedDict()
+        self.groups: dict[Hashable, set[Hashable]] = {}
+
+    def get(self, key: Hashable) -> Any:
+        item = self.data.get(key)
+        if item is None:
+            return None
+        if item[0] < time.monotonic():
+            self._drop(key)
+            return None
+        self.data.move_to_end(key)
+        return item[3]
+
+    def set(self, key: Hashable, group: Hashable, value: Any, size: int) -> None:
+        if key in self.data:
+            self._drop(key)
+        if size > self.maxbytes:
+            return
+        self.data[key] = (time.monotonic() + self.ttl, group, size, value)
+        self.groups.setdefault(group, set()).add(key)
+        self.nbytes += size
+        while len(self.data) > self.maxsize or self.nbytes > self.maxbytes:
+            self._drop(next(iter(self.data)))
+
+    def invalidate(self, group: Hashable) -> None:
+        for key in self.groups.pop(group, ()):
+            self.nbytes -= self.data.pop(key)[2]
+
+    def _drop(self, key: Hashable) -> None:
+        _, group, size, _ = self.data.pop(key)
+        self.nbytes -= size
+        keys = self.groups[group]
+        keys.discard(key)
+        if not keys:
+            del self.groups[group]
+
+
+class _BatchCoalescer:
+    """Queues single-record requests and sends them as one /managed/request call.
+
+    A batch is flushed once `window` seconds have passed since its first record
+    was queued, or as soon as it holds `max_size` records. Each caller gets a
+    DmartResponse carrying only its own record.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[dict[str, Any]]], Awaitable[DmartResponse]],
+        window: float,
+        max_size: int,
+    ):
+        self.send = send
+        self.window = window
+        self.max_size = max_size
+        self.pending: list[tuple[dict[str, Any], asyncio.Future[DmartResponse]]] = []
+        self.pending_keys: set[tuple[str, str]] = set()
+        self.timer: asyncio.TimerHandle | None = None
+        self.tasks: set[asyncio.Task[None]] = set()
+
+    def submit(self, record: dict[str, Any]) -> asyncio.Future[DmartResponse]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[DmartResponse] = loop.create_future()
+        key = _record_key(record)
+        if key in self.pending_keys:
+            # Two outcomes for the same entry can't be told apart in one response
+            self.flush()
+        self.pending.append((record, future))
+        self.pending_keys.add(key)
+        if len(self.pending) >= self.max_size:
+            self.flush()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        self.pending_keys = set()
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _send(self, batch: list[tuple[dict[str, Any], asyncio.Future[DmartResponse]]]) -> None:
+        try:
+            response = await self.send([record for record, _ in batch])
+        except DmartException as e:
+            self._split_error(batch, e)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            self._split_response(batch, response)
+        finally:
+            # Only reached with pending futures when the send itself was cancelled
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    def _split_response(
+        self,
+        batch: list[tuple[dict[str, Any], asyncio.Future[DmartResponse]]],
+        response: DmartResponse,
+    ) -> None:
+        by_key = {(record.subpath, record.shortname): record for record in response.records}
+        for i, (record, future) in enumerate(batch):
+            if future.done():
+                continue
+            match = by_key.get(_record_key(record))
+            # Auto-generated shortnames can't be matched by key, the server keeps the order
+            if match is None and len(response.records) == len(batch):
+                match = response.records[i]
+            if match is None:
+                future.set_exception(DmartException(
+                    status_code=500,
+                    error=Error(type="request", code=500, message="Record missing from the batch response", info=[record]),
+                ))
+            else:
+                future.set_result(response.model_copy(update={"records": [match]}))
+
+    def _split_error(
+        self,
+        batch: list[tuple[dict[str, Any], asyncio.Future[DmartResponse]]],
+        e: DmartException,
+    ) -> None:
+        """Dmart rejects the whole request when any record fails, listing which records
+        went through and which didn't in error.info. Resolve each caller from that."""
+        succeeded: dict[tuple[str, str], Record] = {}
+        failed: dict[tuple[str, str], dict[str, Any]] = {}
+        for info in e.error.info or []:
+            for item in info.get("successfull", info.get("successful")) or []:
+                try:
+                    record = Record.model_validate(item)
+                except ValueError:
+                    continue
+                succeeded[(record.subpath, record.shortname)] = record
+            for item in info.get("failed") or []:
+                if isinstance(item, dict) and isinstance(item.get("record"), dict):
+                    failed[_record_key(item["record"])] = item
+
+        for record, future in batch:
+            if future.done():
+                continue
+            key = _record_key(record)
+            if key in succeeded:
+                future.set_result(DmartResponse(status=Status.success, records=[succeeded[key]]))
+            elif key in failed:
+                item = failed[key]
+                future.set_exception(DmartException(
+                    status_code=e.status_code,
+                    error=Error(
+                        type=e.error.type,
+                        code=item.get("error_code", e.error.code),
+                        message=str(item.get("error", e.error.message)),
+                        info=[item],
+                    ),
+                ))
+            else:
+                # Not listed either way, its outcome is unknown
+                future.set_exception(e)
+
+
+def _record_key(record: dict[str, Any]) -> tuple[str, str]:
+    subpath = record.get("subpath", "")
+    if subpath != "/":
+        subpath = subpath.strip("/")
+    return subpath, record.get("shortname", "")
+
 class DmartService:
     
     session : aiohttp.ClientSession | None = None #  = aiohttp.ClientSession() # connector=aiohttp.TCPConnector())
 
+    _E_LOGIN = "/user/login"
+    _E_LOGOUT = "/user/logout"
+    _E_PROFILE = "/user/profile"
+    _E_REQUEST = "/managed/request"
+    _E_RESOURCE_WITH_PAYLOAD = "/managed/resource_with_payload"
+    _E_DATA_ASSET = "/managed/data-asset"
+    _E_QUERY = "/managed/query"
+    _E_PAYLOAD = "/managed/payload/content/"
+    _E_PROGRESS_TICKET = "/managed/progress-ticket/"
+
     @classmethod
     async def delete_session_pool(cls):
-        if hasattr(cls, 'session') and cls.session:
+        if cls.session:
             await cls.session.close()
             cls.session = None
 
     @classmethod
-    async def create_session_pool(cls):
-        if hasattr(cls, 'session') and not cls.session:
-            cls.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector())
+    async def create_session_pool(cls, timeout: aiohttp.ClientTimeout | None = None):
+        if not cls.session:
+            # Keep idle connections and DNS results around well beyond aiohttp's 15s/10s defaults
+            cls.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=200,
+                    limit_per_host=64,
+                    keepalive_timeout=300,
+                    ttl_dns_cache=300,
+                ),
+                # No overall or read cap so long uploads and slow queries can finish,
+                # only connecting is bounded
+                timeout=timeout or aiohttp.ClientTimeout(total=None, sock_connect=5),
+            )
 
 
-    def __init__(self, url: str, username: str, password: str):
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        batch_window_ms: float = 0,
+        batch_max_size: int = 64,
+        read_ttl_s: float = 0,
+    ):
         self.dmart_url = url
+        # Full URLs of the static endpoints, and prefixes of the dynamic ones
+        self._u_login = url + self._E_LOGIN
+        self._u_logout = url + self._E_LOGOUT
+        self._u_profile = url + self._E_PROFILE
+        self._u_request = url + self._E_REQUEST
+        self._u_resource_with_payload = url + self._E_RESOURCE_WITH_PAYLOAD
+        self._u_data_asset = url + self._E_DATA_ASSET
+        self._u_query = url + self._E_QUERY
+        self._u_payload_prefix = url + self._E_PAYLOAD
+        self._u_progress_ticket_prefix = url + self._E_PROGRESS_TICKET
+        # Parsed once, per-call URLs are derived from it without re-parsing
+        self._base = URL(url)
+        self._entry_base = self._base / "managed" / "entry"
         self.username = username
         self.password = password
+        # When > 0, create/update/delete calls issued within this window are sent together.
+        # If Dmart rejects a batch, each caller gets its own record's outcome from the error info.
+        # Auto shortnames are never batched, and a repeated entry starts a new batch.
+        self.batch_window_ms = batch_window_ms
+        self.batch_max_size = batch_max_size
+        self._coalescers: dict[tuple[str, str, str], _BatchCoalescer] = {}
+        # ETag + body of recent read/read_json_payload responses, revalidated with If-None-Match.
+        # Off unless read_ttl_s > 0, holds at most 2048 responses / 32 MiB per client.
+        self.read_ttl_s = read_ttl_s
+        self._read_cache = _TTLCache(2048, 32 * 1024 * 1024, read_ttl_s) if read_ttl_s > 0 else None
+        self.auth_token: str | None = None
+        self._json_headers: dict[str, str] = {}
+        self._headers: dict[str, str] = {}
+        # Per-method request callables with the auth headers already bound, see __bind_senders
+        self._json_senders: dict[RequestMethod, Callable[..., Any]] = {}
+        self._senders: dict[RequestMethod, Callable[..., Any]] = {}
+        self._senders_session: aiohttp.ClientSession | None = None
         # self.create_session_pool()
 
         
+    @classmethod
+    async def new(
+        cls,
+        url: str,
+        username: str,
+        password: str,
+        batch_window_ms: float = 0,
+        batch_max_size: int = 64,
+        read_ttl_s: float = 0,
+    ) -> "DmartService":
+        """Create a client on the shared session pool (created if needed) and log it in"""
+        await cls.create_session_pool()
+        service = cls(url, username, password, batch_window_ms, batch_max_size, read_ttl_s)
+        await service.connect()
+        return service
+
     async def connect(self):
         json = {
             "shortname": self.username,
@@ -209,26 +574,47 @@ class DmartService:
         }
         if not self.session: 
             raise Exception("Connection pool is not valid")
-        async with self.session.post(url=f"{self.dmart_url}/user/login", headers={"Content-Type": "application/json"}, json=json) as response:
-            resp_json = await response.json()
+        async with self.session.post(url=self._u_login, headers={"Content-Type": "application/json"}, data=to_json(json)) as response:
+            resp_json = from_json(await response.read())
             if (resp_json.get("status", "failed") == "failed" or not resp_json.get("records")):
                 raise ConnectionError("Failed to connect to the Dmart instance, invalid url or credentials") 
 
             self.auth_token = resp_json["records"][0]["attributes"]["access_token"]
+            # Built once per login and reused by every call
+            self._json_headers = {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.auth_token}",
+            }
+            self._headers = {
+                "Authorization": f"Bearer {self.auth_token}",
+            }
+            self.__bind_senders()
 
+    def __bind_senders(self) -> None:
+        if not self.session:
+            raise Exception("Connection pool is not valid")
+        self._senders_session = self.session
+        if not self.auth_token:
+            self._json_senders = {}
+            self._senders = {}
+            return
+        request = self.session.request
+        self._json_senders = {
+            method: partial(request, method.value, headers=self._json_headers)
+            for method in RequestMethod
+        }
+        self._senders = {
+            method: partial(request, method.value, headers=self._headers)
+            for method in RequestMethod
+        }
 
     @property
     def json_headers(self) -> dict[str, str]:
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.auth_token}",
-        }
+        return self._json_headers
 
     @property
     def headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.auth_token}",
-        }
+        return self._headers
             
     # async def login(self, username: str, password: str) -> None:
     #     json = {
@@ -255,74 +641,149 @@ class DmartService:
 
     async def disconnect(self) -> None:
         await self.__api(
-            endpoint="/user/logout",
+            url=self._u_logout,
             method=RequestMethod.post
         )
         self.auth_token = None
-        
+        self._json_headers = {}
+        self._headers = {}
+        self._json_senders = {}
+        self._senders = {}
+
     async def get_profile(self) -> DmartResponse:
         return await self.__api(
-            endpoint="/user/profile",
+            url=self._u_profile,
             method=RequestMethod.get
         )
     
     async def __raw_api(
         self,
-        endpoint: str,
+        url: str | URL,
         method: RequestMethod,
         json: dict[str, Any] | None = None,
-        data: aiohttp.FormData | None = None,
-    ) :
-        if not self.auth_token:
+        data: aiohttp.FormData | bytes | None = None,
+        params: dict[str, str] | None = None,
+        cache_key: tuple[Any, ...] | None = None,
+    ) -> bytes | None:
+        """Body of a 200 (or a 304 served from the read cache), None for a 204 No Content"""
+        if self._senders_session is not self.session:
+            # The shared pool was recreated since connect()
+            self.__bind_senders()
+        send = (self._json_senders if json is not None else self._senders).get(method)
+        if send is None:
             raise DmartException(status_code=401, error=Error(code=10, type="login", message="Not authenticated Dmart user"))
 
-        if not self.session: 
-            raise Exception("Connection pool is not valid")
-        async with self.session.request(method.value, f"{self.dmart_url}{endpoint}", headers=self.json_headers if json else self.headers, json=json, data=data) as response:
-            resp_json = await response.json()
-            if response is None or response.status != 200:
-                raise DmartException(
-                    status_code = response.status,
-                    error = Error.model_validate(resp_json["error"])
-                )
+        if json is not None:
+            data = to_json(json)
+        cached: tuple[str, bytes] | None = None
+        if cache_key is not None and self._read_cache is not None:
+            cached = self._read_cache.get(cache_key)
+        if cached is not None:
+            request = send(url, data=data, params=params, headers={**self._headers, "If-None-Match": cached[0]})
+        else:
+            request = send(url, data=data, params=params)
+        async with request as response:
+            if response.status == 200:
+                # Callers validate the raw body with pydantic-core directly, no intermediate dict
+                raw = await response.read()
+                if cache_key is not None and self._read_cache is not None:
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        # Grouped by (space_name, subpath, shortname) for invalidate()
+                        self._read_cache.set(cache_key, cache_key[:3], (etag, raw), len(raw))
+                return raw
+            if response.status == 304 and cached is not None:
+                return cached[1]
+            if response.status == 204:
+                return None
+            raise DmartException(
+                status_code = response.status,
+                error = _error_from_body(response.status, await response.read())
+            )
 
-            return resp_json 
+    def invalidate(self, space_name: str, subpath: str, shortname: str) -> None:
+        """Drop the cached read/read_json_payload responses of an entry"""
+        if self._read_cache is not None:
+            self._read_cache.invalidate((space_name, subpath.strip("/"), shortname))
 
     async def __api(
         self,
-        endpoint: str,
+        url: str,
         method: RequestMethod,
         json: dict[str, Any] | None = None,
-        data: aiohttp.FormData | None = None,
+        data: aiohttp.FormData | bytes | None = None,
     ) -> DmartResponse:
-            response = await self.__raw_api(endpoint, method, json, data)
-            return DmartResponse.model_validate(response) 
+        raw = await self.__raw_api(url, method, json, data)
+        if raw is None:
+            return DmartResponse(status=Status.success)
+        return DmartResponse.model_validate_json(raw)
+
+    async def __gather_bounded(self, calls: list[Callable[[], Awaitable[Any]]], max_concurrency: int) -> list[Any]:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Calls are only started once they hold a slot, queued ones never create a coroutine
+        async def bounded(call: Callable[[], Awaitable[Any]]) -> Any:
+            async with semaphore:
+                return await call()
+
+        # A TaskGroup cancels the calls still queued or running as soon as one fails
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(bounded(call)) for call in calls]
+        except ExceptionGroup as e:
+            raise e.exceptions[0]
+        return [task.result() for task in tasks]
 
     async def __request(
         self,
         space_name: str,
         subpath: str,
         shortname: str,
-        request_type: RequestType,
+        request_type: RequestType | str,
         attributes: dict[str, Any] = {},
         resource_type: ResourceType = ResourceType.content,
     ) -> DmartResponse:
-        return await self.__api(
-            "/managed/request",
+        record = {
+            "resource_type": resource_type,
+            "subpath": subpath,
+            "shortname": shortname,
+            "attributes": attributes,
+        }
+        # An auto shortname can't be matched back to its caller if the batch fails
+        if self.batch_window_ms <= 0 or shortname == "auto":
+            return await self.bulk_request(space_name, request_type, [record])
+
+        key = (space_name, request_type, resource_type)
+        coalescer = self._coalescers.get(key)
+        if coalescer is None:
+            async def send(records: list[dict[str, Any]]) -> DmartResponse:
+                return await self.bulk_request(space_name, request_type, records)
+
+            coalescer = _BatchCoalescer(send, self.batch_window_ms / 1000, self.batch_max_size)
+            self._coalescers[key] = coalescer
+        return await coalescer.submit(record)
+
+    async def bulk_request(
+        self,
+        space_name: str,
+        request_type: RequestType | str,
+        records: list[dict[str, Any]],
+    ) -> DmartResponse:
+        """Send several records of the same request type in a single call"""
+        response = await self.__api(
+            self._u_request,
             RequestMethod.post,
             {
                 "space_name": space_name,
                 "request_type": request_type,
-                "records": [
-                    {
-                        "resource_type": resource_type,
-                        "subpath": subpath,
-                        "shortname": shortname,
-                        "attributes": attributes,
-                    }
-                ],
+                "records": records,
             },
         )
+        for record in records:
+            self.invalidate(space_name, record["subpath"], record["shortname"])
+        return response
 
     async def create(
         self,
@@ -336,7 +797,7 @@ class DmartService:
             space_name,
             subpath,
             shortname,
-            RequestType.create,
+            _REQ_CREATE,
             attributes,
             resource_type,
         )
@@ -345,16 +806,22 @@ class DmartService:
         self,
         space_name: str,
         record: dict[str, Any],
-        payload: BinaryIO,
+        payload: BinaryIO | bytes | str | PathLike[str],
         payload_file_name: str,
         payload_mime_type: str,
     ):
-        record_file = BytesIO(bytes(json.dumps(record), "utf-8"))
+        if isinstance(payload, (str, PathLike)):
+            # aiohttp streams file objects in chunks, the file is never read into memory as a whole
+            with open(payload, "rb") as payload_file:
+                return await self.upload_resource_with_payload(
+                    space_name, record, payload_file, payload_file_name, payload_mime_type
+                )
 
+        # Both parts are handed to aiohttp as-is: bytes are sent without copying, file objects are streamed
         data = aiohttp.FormData()
         data.add_field(
             "request_record",
-            record_file,
+            to_json(record),
             filename="record.json",
             content_type="application/json",
         )
@@ -366,11 +833,14 @@ class DmartService:
         )
         data.add_field("space_name", space_name)
 
-        return await self.__api(
-            endpoint="/managed/resource_with_payload",
+        response = await self.__api(
+            url=self._u_resource_with_payload,
             method=RequestMethod.post,
             data=data,
         )
+        if "subpath" in record and "shortname" in record:
+            self.invalidate(space_name, record["subpath"], record["shortname"])
+        return response
 
     async def query_data_asset(
         self,
@@ -383,7 +853,7 @@ class DmartService:
         resource_type: ResourceType = ResourceType.content,
     ) -> DmartResponse:
         return await self.__api(
-            "/managed/data-asset",
+            self._u_data_asset,
             RequestMethod.post,
             {
                 "space_name": space_name,
@@ -404,22 +874,49 @@ class DmartService:
         retrieve_attachments: bool = False,
         resource_type: ResourceType = ResourceType.content,
     ) -> Entry:
+        subpath = subpath.strip("/")
         response = await self.__raw_api(
-            (
-                f"/managed/entry/{resource_type}/{space_name}/{subpath}/{shortname}"
-                f"?retrieve_json_payload=true&retrieve_attachments={retrieve_attachments}"
-            ),
+            # Dmart addresses the root subpath as __root__ in URLs
+            self._entry_base.joinpath(resource_type, space_name, subpath or "__root__", shortname),
             RequestMethod.get,
+            params={
+                "retrieve_json_payload": "true",
+                "retrieve_attachments": "true" if retrieve_attachments else "false",
+            },
+            cache_key=(space_name, subpath, shortname, resource_type, retrieve_attachments),
+        )
+        if response is None:
+            raise DmartException(
+                status_code=204,
+                error=Error(type="request", code=204, message="No entry returned by the server"),
+            )
+        return Entry.model_validate_json(response)
+
+    async def bulk_read(
+        self,
+        items: list[tuple[str, str, str]],
+        retrieve_attachments: bool = False,
+        resource_type: ResourceType = ResourceType.content,
+        max_concurrency: int = 32,
+    ) -> list[Entry]:
+        """Read many (space_name, subpath, shortname) entries concurrently, results keep the input order"""
+        return await self.__gather_bounded(
+            [
+                partial(self.read, space_name, subpath, shortname, retrieve_attachments, resource_type)
+                for space_name, subpath, shortname in items
+            ],
+            max_concurrency,
         )
-        return Entry.model_validate(response)
 
     async def read_json_payload(
         self, space_name: str, subpath: str, shortname: str
     ) -> Any:
-        return await self.__raw_api(
-            f"/managed/payload/content/{space_name}/{subpath}/{shortname}.json",
+        raw = await self.__raw_api(
+            "".join([self._u_payload_prefix, space_name, "/", subpath, "/", shortname, ".json"]),
             RequestMethod.get,
+            cache_key=(space_name, subpath.strip("/"), shortname, "payload"),
         )
+        return from_json(raw) if raw is not None else None
 
     async def query(
         self,
@@ -430,17 +927,54 @@ class DmartService:
         **kwargs: Any,
     ) -> DmartResponse:
         return await self.__api(
-            "/managed/query",
+            self._u_query,
             RequestMethod.post,
-            {
-                "type": "search",
-                "space_name": space_name,
-                "subpath": subpath,
-                "retrieve_json_payload": True,
-                "filter_schema_names": filter_schema_names,
-                "search": search,
-                **kwargs,
-            },
+            self.__query_json(space_name, subpath, search, filter_schema_names, **kwargs),
+        )
+
+    async def query_lazy(
+        self,
+        space_name: str,
+        subpath: str,
+        search: str = "",
+        filter_schema_names: list[str] = [],
+        **kwargs: Any,
+    ) -> RawDmartResponse:
+        """Same as `query`, but the records are only validated as they are accessed"""
+        raw = await self.__raw_api(
+            self._u_query,
+            RequestMethod.post,
+            self.__query_json(space_name, subpath, search, filter_schema_names, **kwargs),
+        )
+        return RawDmartResponse(from_json(raw) if raw is not None else {"status": Status.success})
+
+    def __query_json(
+        self,
+        space_name: str,
+        subpath: str,
+        search: str,
+        filter_schema_names: list[str],
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        return {
+            "type": "search",
+            "space_name": space_name,
+            "subpath": subpath,
+            "retrieve_json_payload": True,
+            "filter_schema_names": filter_schema_names,
+            "search": search,
+            **kwargs,
+        }
+
+    async def bulk_query(
+        self,
+        queries: list[dict[str, Any]],
+        max_concurrency: int = 32,
+    ) -> list[DmartResponse]:
+        """Run many queries concurrently, each dict holds the keyword arguments of `query`"""
+        return await self.__gather_bounded(
+            [partial(self.query, **query) for query in queries],
+            max_concurrency,
         )
 
     async def update(
@@ -455,7 +989,7 @@ class DmartService:
             space_name,
             subpath,
             shortname,
-            RequestType.update,
+            _REQ_UPDATE,
             attributes,
             resource_type,
         )
@@ -471,11 +1005,13 @@ class DmartService:
         request_body = None
         if cancellation_reasons:
             request_body = {"resolution": cancellation_reasons}
-        return await self.__api(
-            (f"/managed/progress-ticket/{space_name}/{subpath}/{shortname}/{action}"),
+        response = await self.__api(
+            "".join([self._u_progress_ticket_prefix, space_name, "/", subpath, "/", shortname, "/", action]),
             RequestMethod.put,
             json=request_body,
         )
+        self.invalidate(space_name, subpath, shortname)
+        return response
 
     async def delete(
         self,
@@ -484,18 +1020,11 @@ class DmartService:
         shortname: str,
         resource_type: ResourceType = ResourceType.content,
     ) -> DmartResponse:
-        json: dict[str, Any] = {
-            "space_name": space_name,
-            "request_type": RequestType.delete,
-            "records": [
-                {
-                    "resource_type": resource_type,
-                    "subpath": subpath,
-                    "shortname": shortname,
-                    "attributes": {},
-                }
-            ],
-        }
-        return await self.__api("/managed/request", RequestMethod.post, json)
-
-
+        return await self.__request(
+            space_name,
+            subpath,
+            shortname,
+            _REQ_DELETE,
+            {},
+            resource_type,
+        )